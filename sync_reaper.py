@@ -1,7 +1,19 @@
+import atexit
 import os
 import shutil
-from datetime import datetime
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+import hashlib
 import sys
+import threading
+import time
+
+try:
+    import xxhash  # Optional, much faster content hashing
+except ImportError:
+    xxhash = None
 
 SUB_FOLDERS = ["", 
                "FXChains", 
@@ -32,18 +44,49 @@ TEST_MODE = any(arg in ("--test", "-t") for arg in sys.argv)
 if any(arg in ("-v", "--verbose") for arg in sys.argv):
     VERBOSE = True
 
+# Opened once and flushed on exit instead of re-opening the file for every line
+_LOG_FH = open(LOG_FILEPATH, "a", encoding="utf-8", buffering=8192)
+atexit.register(_LOG_FH.close)
+
+_last_log_second = None
+_last_log_timestamp = ""
+
+def log_timestamp():
+    """
+    Return the log timestamp of the current second.
+    It is only formatted again once the second has changed.
+    """
+    global _last_log_second, _last_log_timestamp
+    now = int(time.time())
+    if now != _last_log_second:
+        _last_log_second = now
+        _last_log_timestamp = time.strftime("[%Y-%m-%d %H:%M:%S]", time.localtime(now))
+    return _last_log_timestamp
+
+def format_mtime(mtime):
+    """
+    Format a modification time (seconds since the epoch) for display.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime))
+
 def log_print(*args, **kwargs):
     """
     Print to console (if VERBOSE) and append to log file, with date and time.
     """
-    from datetime import datetime
     msg = " ".join(str(a) for a in args)
-    timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+    timestamp = log_timestamp()
     log_line = f"{timestamp} {msg}"
     if VERBOSE:
         print(log_line, **kwargs)
-    with open(LOG_FILEPATH, "a", encoding="utf-8") as f:
-        f.write(log_line + "\n")
+    _LOG_FH.write(log_line + "\n")
+
+def ask_user(prompt):
+    """
+    Flush the buffered log file, then ask the user for input.
+    This keeps the log complete even if the script is closed while it waits.
+    """
+    _LOG_FH.flush()
+    return input(prompt)
 
 def print_headline(text):
     """
@@ -57,6 +100,221 @@ def print_headline(text):
     log_print("=" * 80 + "\n")
 
 
+@lru_cache(maxsize=8192)
+def normalize_path(path):
+    """
+    Return the normalized, case-normalized form of a path, used as lookup key.
+    Cached, since the same folders are looked up over and over during a run.
+    """
+    return os.path.normcase(os.path.normpath(path))
+
+@lru_cache(maxsize=8192)
+def split_normalized(path):
+    """
+    Split a path into its normalized parent folder and its case-normalized file name.
+    """
+    parent, name = os.path.split(os.path.normpath(path))
+    return parent, os.path.normcase(name)
+
+
+class StatCache:
+    """
+    Cache of directory listings and file stat results.
+    Every directory is scanned at most once per run. The DirEntry objects of a scan
+    are kept, so the stat data of an entry is only fetched when it is needed
+    (on Windows it already comes with the listing).
+    Folders are scanned in background threads while the main thread writes, so
+    changes to and iteration over the listings are guarded by a lock.
+    """
+    STALE = object()  # Entry exists, but its stat data has to be fetched again
+    HASH_BUFFER_SIZE = 1 << 20
+
+    def __init__(self):
+        self.dirs = {}
+        self.lock = threading.Lock()
+        self.digests = {}
+        self.hash_buffer = bytearray(self.HASH_BUFFER_SIZE)
+
+    def dir_key(self, dir_path):
+        return normalize_path(dir_path)
+
+    def listing(self, dir_path):
+        """
+        Return the cached entries of a directory, scanning it on first access.
+
+        Returns:
+            dict: {normcased_name: DirEntry, os.stat_result or STALE}, None if the directory does not exist.
+        """
+        key = self.dir_key(dir_path)
+        with self.lock:
+            if key in self.dirs:
+                return self.dirs[key]
+        try:
+            with os.scandir(dir_path) as it:
+                entries = {os.path.normcase(entry.name): entry for entry in it}
+        except OSError:
+            entries = None
+        with self.lock:
+            return self.dirs.setdefault(key, entries)
+
+    def prefetch(self, dir_paths):
+        """
+        Scan several directories in parallel, e.g. config roots on different drives.
+        """
+        missing = [dir_path for dir_path in dir_paths if self.dir_key(dir_path) not in self.dirs]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                list(executor.map(self.listing, missing))
+
+    def store_listing(self, dir_path, entries):
+        """
+        Store the entries of a directory that has just been scanned elsewhere.
+        """
+        with self.lock:
+            self.dirs[self.dir_key(dir_path)] = entries
+
+    def entry(self, path):
+        """
+        Return the cached entry of a path without fetching stat data, or None if it does not exist.
+        """
+        parent, name = split_normalized(path)
+        entries = self.listing(parent)
+        if entries is None:
+            return None
+        return entries.get(name)
+
+    def get(self, path):
+        """
+        Return the stat result of a path, or None if it does not exist.
+        """
+        parent, name = split_normalized(path)
+        entries = self.listing(parent)
+        if entries is None:
+            return None
+        return self.resolve(entries, name, path)
+
+    def resolve(self, entries, name, path):
+        """
+        Return the stat result of an entry of a cached listing, fetching it if needed.
+        Returns None if the entry does not exist.
+        """
+        entry = entries.get(name)
+        if entry is None or isinstance(entry, os.stat_result):
+            return entry
+        try:
+            st = os.stat(path) if entry is self.STALE else entry.stat()
+        except OSError:
+            entries.pop(name, None)
+            return None
+        entries[name] = st
+        return st
+
+    def find_files(self, dir_path, names):
+        """
+        Look up several file names in a single directory listing.
+        Names are matched case-insensitively, also on case-sensitive filesystems,
+        so e.g. 'REAPER.ini' finds 'reaper.ini'. An exact match is preferred.
+
+        Args:
+            dir_path (str): Directory to look in.
+            names (list): File names to look for.
+
+        Returns:
+            list: (name, full_path, stat_result) for every name that is an existing file.
+                  full_path uses the name as found on disk.
+        """
+        entries = self.listing(dir_path)
+        if not entries:
+            return []
+        lowered = {}
+        for key in list(entries):
+            lowered.setdefault(key.lower(), key)
+        found = []
+        for name in names:
+            key = os.path.normcase(name)
+            if key not in entries:
+                key = lowered.get(name.lower(), key)
+            fpath = os.path.join(dir_path, name if key == os.path.normcase(name) else key)
+            st = self.resolve(entries, key, fpath)
+            if st is not None and stat.S_ISREG(st.st_mode):
+                found.append((name, fpath, st))
+        return found
+
+    # Listings are keyed by os.path.normcase, which is case-sensitive on every POSIX
+    # system, even on case-insensitive filesystems (the macOS default). A miss is
+    # therefore confirmed on disk before a path is reported as missing.
+
+    def exists(self, path):
+        return self.entry(path) is not None or os.path.lexists(path)
+
+    def isdir(self, path):
+        entry = self.entry(path)
+        if entry is None:
+            return os.path.isdir(path)
+        if isinstance(entry, os.DirEntry):
+            return entry.is_dir()
+        st = self.get(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def digest(self, path):
+        """
+        Return a digest of the file content: xxh3_64 if xxhash is installed, blake2b otherwise.
+        Digests are cached per (path, size, mtime), so an unchanged file is only read once.
+        """
+        st = self.get(path)
+        if st is None:
+            raise FileNotFoundError(path)
+        key = (self.dir_key(path), st.st_size, st.st_mtime_ns)
+        digest = self.digests.get(key)
+        if digest is None:
+            hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+            buf = self.hash_buffer
+            view = memoryview(buf)
+            with open(path, 'rb') as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+            digest = hasher.digest()
+            self.digests[key] = digest
+        return digest
+
+    def mark_written(self, path):
+        """
+        Record that a file or folder has been created or written.
+        Its stat data is fetched again on next access, and parent folders are recorded as existing.
+        """
+        parent, name = os.path.split(os.path.normpath(path))
+        written = True
+        with self.lock:
+            while name:
+                key = self.dir_key(parent)
+                name = os.path.normcase(name)
+                if key in self.dirs:
+                    entries = self.dirs[key]
+                    if entries is None:
+                        self.dirs[key] = {name: self.STALE}  # Parent was missing and has just been created
+                    elif not written and name in entries:
+                        break  # Known folder, so are all its parents
+                    else:
+                        entries[name] = self.STALE
+                written = False
+                parent, name = os.path.split(parent)
+
+    def forget_tree(self, dir_path):
+        """
+        Drop the cached listings of a directory and everything below it,
+        e.g. after a whole tree has been copied into it.
+        """
+        key = self.dir_key(dir_path)
+        prefix = os.path.join(key, "")
+        with self.lock:
+            for cached_key in [k for k in self.dirs if k == key or k.startswith(prefix)]:
+                del self.dirs[cached_key]
+
+STAT_CACHE = StatCache()
+
 def get_file_properties(filepath):
     """
     Return file properties for the given file path.
@@ -65,14 +323,58 @@ def get_file_properties(filepath):
         filepath (str): Path to the file.
 
     Returns:
-        dict: Dictionary with file size, modification time, and creation time.
+        os.stat_result: Stat result with st_size, st_mtime and st_ctime.
+    """
+    st = STAT_CACHE.get(filepath)
+    if st is None:
+        st = os.stat(filepath)  # Raises for a missing file, as before
+    return st
+
+def build_config_prefixes(paths_key, folders):
+    """
+    Build the normalized folder prefixes used by find_config_for_path.
+
+    Args:
+        paths_key (tuple): Tuple of (config, path) pairs.
+        folders (list): Subfolder names.
+
+    Returns:
+        dict: {folder: [(config, base_path, folder_prefix), ...]}
     """
-    stat = os.stat(filepath)
-    return {
-        'size': stat.st_size,
-        'mtime': stat.st_mtime,
-        'ctime': stat.st_ctime,
-    }
+    prefixes = {}
+    for folder in folders:
+        for config, base_path in paths_key:
+            folder_path = normalize_path(os.path.join(base_path, folder))
+            folder_prefix = os.path.join(folder_path, "")  # Ensure trailing separator
+            prefixes.setdefault(folder, []).append((config, base_path, folder_prefix))
+    return prefixes
+
+CONFIG_PATHS = tuple((p["config"], p["path"]) for p in COMPARE_PATHS)
+CONFIG_PREFIXES = build_config_prefixes(CONFIG_PATHS, SUB_FOLDERS)
+
+def config_paths_key(paths):
+    """
+    Return the given paths as a hashable tuple of (config, path) pairs.
+    """
+    if paths is COMPARE_PATHS:
+        return CONFIG_PATHS
+    return tuple((p["config"], p["path"]) for p in paths)
+
+@lru_cache(maxsize=4096)
+def _find_config_cached(fpath, folder, paths_key):
+    """
+    Cached lookup behind find_config_for_path.
+    The path is only normalized on a cache miss.
+    """
+    fpath_norm = normalize_path(fpath)
+    if paths_key == CONFIG_PATHS and folder in CONFIG_PREFIXES:
+        prefixes = CONFIG_PREFIXES[folder]
+    else:
+        prefixes = build_config_prefixes(paths_key, [folder])[folder]
+    for config, base_path, folder_prefix in prefixes:
+        if fpath_norm.startswith(folder_prefix):
+            return config, base_path
+    return None, None
 
 def find_config_for_path(fpath, folder, paths):
     """
@@ -86,49 +388,203 @@ def find_config_for_path(fpath, folder, paths):
     Returns:
         tuple: (config, base_path) if found, otherwise (None, None).
     """
-    for p in paths:
-        folder_path = os.path.join(p["path"], folder)
+    return _find_config_cached(fpath, folder, config_paths_key(paths))
+
+_KNOWN_DIRS = set()
+
+def ensure_dir(dir_path):
+    """
+    Make sure a folder exists. Each folder is checked (and created if needed) only once per run.
+    """
+    if dir_path in _KNOWN_DIRS:
+        return
+    if not STAT_CACHE.isdir(dir_path):
+        os.makedirs(dir_path, exist_ok=True)
+        STAT_CACHE.mark_written(dir_path)
+    _KNOWN_DIRS.add(dir_path)
+
+def make_parent_dirs(path):
+    """
+    Create the parent folders of a file path if they do not exist yet.
+    """
+    ensure_dir(os.path.dirname(path))
+
+_HAS_FWALK = hasattr(os, "fwalk") and os.stat in os.supports_dir_fd
+
+def iter_files(folder_path):
+    """
+    Yield all files below the given folder.
+    Where available (POSIX), the tree is walked with os.fwalk and files are stat'ed
+    relative to the open folder descriptor, so no full path has to be resolved per file.
+    Elsewhere (Windows) it is walked with os.scandir and an explicit stack, where the
+    stat data comes with the directory listing.
+
+    Args:
+        folder_path (str): Folder to scan.
+
+    Yields:
+        tuple: (full_path, relative_path, stat_result) for each file.
+    """
+    if _HAS_FWALK:
+        yield from _iter_files_fwalk(folder_path)
+    else:
+        yield from _iter_files_scandir(folder_path)
+
+def _iter_files_fwalk(folder_path):
+    prefix_len = len(os.path.join(folder_path, ""))
+    for root, dirs, files, rootfd in os.fwalk(folder_path):
+        # Relative folder, derived once per folder instead of once per file
+        rel_root = os.path.join(root[prefix_len:], "") if len(root) > prefix_len else ""
+        entries = {os.path.normcase(name): StatCache.STALE for name in dirs}
+        for name in files:
+            try:
+                st = os.stat(name, dir_fd=rootfd)
+            except OSError:
+                continue  # E.g. a broken symlink
+            entries[os.path.normcase(name)] = st
+            if stat.S_ISREG(st.st_mode):
+                yield os.path.join(root, name), rel_root + name, st
+        STAT_CACHE.store_listing(root, entries)
+
+def _iter_files_scandir(folder_path):
+    stack = [(folder_path, "")]
+    while stack:
+        dir_path, rel_root = stack.pop()
         try:
-            if os.path.commonpath([os.path.abspath(fpath), os.path.abspath(folder_path)]) == os.path.abspath(folder_path):
-                return p["config"], p["path"]
-        except ValueError:
-            continue
-    return None, None
+            it = os.scandir(dir_path)
+        except OSError:
+            continue  # Unreadable folder, skipped like os.walk does
+        entries = {}
+        sub_dirs = []
+        with it:
+            for entry in it:
+                name = os.path.normcase(entry.name)
+                entries[name] = entry
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append((entry.path, rel_root + entry.name + os.sep))
+                elif entry.is_file():
+                    st = entry.stat()
+                    entries[name] = st
+                    yield entry.path, rel_root + entry.name, st
+        STAT_CACHE.store_listing(dir_path, entries)
+        stack.extend(reversed(sub_dirs))  # Visit subfolders in listing order, like os.walk
+
+def versions_identical(versions):
+    """
+    Check whether all versions of a file have the same size and modification time.
+    """
+    first_props = versions[0][1]
+    ref = (first_props.st_size, first_props.st_mtime)
+    return all((props.st_size, props.st_mtime) == ref for _, props in islice(versions, 1, None))
 
-def collect_files_in_folder(folder, paths, root_files=None):
+def collect_files_in_folder(folder, paths, root_files=None, divergent_only=False):
     """
     Collect files in the given folder for all paths.
     If folder is '', only files in root_files are considered.
-    Returns a dict: {relative_path: [(full_path, file_properties), ...]}
+    With divergent_only, files whose versions are all identical are left out.
+    Returns a dict: {relative_path: [(full_path, stat_result), ...]}
     """
+    STAT_CACHE.prefetch([path["path"] for path in paths])
     file_versions = {}
     for path in paths:
         folder_path = os.path.join(path["path"], folder)
-        if not os.path.isdir(folder_path):
+        if not STAT_CACHE.isdir(folder_path):
             continue
         if folder == "" and root_files:
-            for fname in root_files:
-                fpath = os.path.join(folder_path, fname)
-                if os.path.isfile(fpath):
-                    props = get_file_properties(fpath)
-                    file_versions.setdefault(fname, []).append((fpath, props))
+            for fname, fpath, props in STAT_CACHE.find_files(path["path"], root_files):
+                file_versions.setdefault(fname, []).append((fpath, props))
         else:
-            for root, _, files in os.walk(folder_path):
-                for fname in files:
-                    fpath = os.path.join(root, fname)
-                    rel_path = os.path.relpath(fpath, folder_path)
-                    props = get_file_properties(fpath)
-                    file_versions.setdefault(rel_path, []).append((fpath, props))
+            for fpath, rel_path, st in iter_files(folder_path):
+                file_versions.setdefault(rel_path, []).append((fpath, st))
+    if divergent_only:
+        file_versions = {rel_path: versions for rel_path, versions in file_versions.items()
+                         if len(versions) < 2 or not versions_identical(versions)}
     return file_versions
 
+def version_mtime(version):
+    """
+    Key function returning the modification time of a (path, props) version tuple.
+    """
+    return version[1].st_mtime
+
+def copy_file_times(src, dst):
+    """
+    Copy access and modification time from src to dst without copying the content.
+    """
+    st = get_file_properties(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    STAT_CACHE.mark_written(dst)
+
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+    _CopyFileExW = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    _CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD]
+    _CopyFileExW.restype = wintypes.BOOL
+else:
+    _CopyFileExW = None
+
+def copy_file_windows(src, dst):
+    """
+    Copy the content of src to dst with the Windows CopyFileExW API, so the
+    copy runs in the kernel, also between different drives.
+    """
+    if not _CopyFileExW(src, dst, None, None, None, 0):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+def copy_file_range_all(src, dst):
+    """
+    Copy the content of src to dst with os.copy_file_range, so the kernel
+    moves the data (or clones the blocks) without going through Python.
+    Raises OSError if fewer bytes than the source size were copied, as some
+    filesystems report end of file early.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        while True:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+            if not n:
+                break
+            copied += n
+    if copied < size:
+        raise OSError(f"copy_file_range copied {copied} of {size} bytes from {src!r}")
+
+def fast_copy(src, dst):
+    """
+    Copy a file including its metadata, like shutil.copy2.
+    Uses CopyFileExW on Windows and os.copy_file_range where available,
+    and falls back to shutil.copyfile.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination file path.
+    """
+    kernel_copy = copy_file_windows if _CopyFileExW is not None else (
+        copy_file_range_all if hasattr(os, "copy_file_range") else None)
+    if kernel_copy is not None:
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        try:
+            kernel_copy(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)  # e.g. cross-device copy on older Linux kernels, or a short copy
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
 def log_or_write(action, src, dst):
     if TEST_MODE:
         log_print(f"[TEST MODE] Would {action}: {src} -> {dst}")
     else:
         if action == "copy":
-            shutil.copy2(src, dst)
+            fast_copy(src, dst)
         elif action == "update":
-            shutil.copy2(src, dst)
+            fast_copy(src, dst)
+        elif action == "retime":
+            copy_file_times(src, dst)
+        STAT_CACHE.mark_written(dst)
         log_print(f"{action.capitalize()}d {src} to {dst}")
 
 def sync_file_versions(fname, versions, folder, paths, root_files=None, reaper_ini_sections=None):
@@ -143,36 +599,38 @@ def sync_file_versions(fname, versions, folder, paths, root_files=None, reaper_i
         for path in paths:
             folder_path = os.path.join(path["path"], folder)
             target_path = os.path.join(folder_path, fname)
-            target_config, target_base = find_config_for_path(target_path, folder, paths)
-            if not os.path.exists(target_path):
+            target_config = path["config"]  # Target is built from this config, no lookup needed
+            if not STAT_CACHE.exists(target_path):
                 log_print(f"\nNew file detected: {fname}")
                 log_print(f"  [config]: {config} | [path]: {base_path}")
-                log_print(f"  Size: {only_props['size']} bytes | Modified: {datetime.fromtimestamp(only_props['mtime'])}")
-                resp = input(f"Copy new file '{fname}' to '{target_config}'? (y/n): ")
+                log_print(f"  Size: {only_props.st_size} bytes | Modified: {format_mtime(only_props.st_mtime)}")
+                resp = ask_user(f"Copy new file '{fname}' to '{target_config}'? (y/n): ")
                 log_print(f"User response for copying new file '{fname}' to '{target_config}': {resp}")
                 if resp.lower() == 'y':
-                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                    make_parent_dirs(target_path)
                     log_or_write("copy", only_path, target_path)
         return True
     # If all versions have the same modification date AND size, skip prompt and do not log
-    mtimes = set([props['mtime'] for _, props in versions])
-    sizes = set([props['size'] for _, props in versions])
-    if len(mtimes) == 1 and len(sizes) == 1:
+    if versions_identical(versions):
         return False
     # Multiple versions found, ask user which to keep
-    versions.sort(key=lambda x: x[1]['mtime'], reverse=True)
+    versions.sort(key=version_mtime, reverse=True)
     log_print(f"\nMultiple versions found for file: {fname}")
     for idx, (path, props) in enumerate(versions):
         config, base_path = find_config_for_path(path, folder, paths)
-        log_print(f"[{idx+1}] {path} | [config]: {config} | [path]: {base_path} | Size: {props['size']} | Modified: {datetime.fromtimestamp(props['mtime'])}")
-    choice = input(f"Which version of '{fname}' do you want to keep? Enter number (1-{len(versions)}): ")
+        log_print(f"[{idx+1}] {path} | [config]: {config} | [path]: {base_path} | Size: {props.st_size} | Modified: {format_mtime(props.st_mtime)}")
+    choice = ask_user(f"Which version of '{fname}' do you want to keep? Enter number (1-{len(versions)}): ")
     log_print(f"User chose version {choice} for file '{fname}'")
     try:
         keep_idx = int(choice) - 1
         keep_path, keep_props = versions[keep_idx]
-        for idx, (path, _) in enumerate(versions):
+        for idx, (path, props) in enumerate(versions):
             if idx != keep_idx:
-                log_or_write("update", keep_path, path)
+                # Same content: only the timestamp needs syncing
+                same_content = (props.st_size == keep_props.st_size and
+                                STAT_CACHE.digest(keep_path) == STAT_CACHE.digest(path))
+                action = "retime" if same_content else "update"
+                log_or_write(action, keep_path, path)
         return True
     except Exception as e:
         log_print(f"Invalid choice or error: {e}")
@@ -195,150 +653,267 @@ def update_reaper_ini_sections(old_path, newest_path, old_config, newest_config,
             log_print(f"[{section}] section updated in {old_path}")
         else:
             log_print(f"No [{section}] section found in {newest_path}")
+    to_ini.flush()
 
-def auto_update_root_files(paths, root_files):
+def auto_update_root_files(paths, root_files, file_versions=None):
     """
     Automatically update root files (except reaper.ini) without user confirmation.
     Only replace if file properties (size or mtime) differ.
+    Pass file_versions to reuse an existing collection of the root folder.
     """
-    for fname in root_files:
+    if file_versions is None:
+        file_versions = collect_files_in_folder("", paths, root_files=root_files)
+    for fname, versions in file_versions.items():
         if fname.lower() == "reaper.ini":
             continue  # Handled separately
-        file_versions = collect_files_in_folder("", paths, root_files=[fname])
-        for _, versions in file_versions.items():
-            if len(versions) < 2:
-                only_path, only_props = versions[0]
-                for path in paths:
-                    target_path = os.path.join(path["path"], fname)
-                    if not os.path.exists(target_path):
-                        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                        shutil.copy2(only_path, target_path)
-                        log_print(f"[AUTO] Copied {only_path} to {target_path}")
-            else:
-                versions.sort(key=lambda x: x[1]['mtime'], reverse=True)
-                newest_path, newest_props = versions[0]
-                for old_path, old_props in versions[1:]:
-                    if os.path.abspath(newest_path) != os.path.abspath(old_path):
-                        # Only replace if file properties differ
-                        if (newest_props['size'] != old_props['size'] or
-                            newest_props['mtime'] != old_props['mtime']):
-                            shutil.copy2(newest_path, old_path)
+        if len(versions) < 2:
+            only_path, only_props = versions[0]
+            for path in paths:
+                target_path = os.path.join(path["path"], fname)
+                if not STAT_CACHE.exists(target_path):
+                    make_parent_dirs(target_path)
+                    fast_copy(only_path, target_path)
+                    STAT_CACHE.mark_written(target_path)
+                    log_print(f"[AUTO] Copied {only_path} to {target_path}")
+        else:
+            newest = max(versions, key=version_mtime)
+            newest_path, newest_props = newest
+            for old_path, old_props in [v for v in versions if v is not newest]:
+                if newest_path != old_path:
+                    # Only replace if file properties differ
+                    if (newest_props.st_size, newest_props.st_mtime) != (old_props.st_size, old_props.st_mtime):
+                        # Same size but different mtime: compare content before copying
+                        if (newest_props.st_size == old_props.st_size and
+                                STAT_CACHE.digest(newest_path) == STAT_CACHE.digest(old_path)):
+                            copy_file_times(newest_path, old_path)
+                            log_print(f"[AUTO] Retimed {old_path} with {newest_path}")
+                        else:
+                            fast_copy(newest_path, old_path)
+                            STAT_CACHE.mark_written(old_path)
                             log_print(f"[AUTO] Updated {old_path} with {newest_path}")
 
-def auto_update_reaper_ini_sections(paths, sections):
+def auto_update_reaper_ini_sections(paths, sections, file_versions=None):
     """
     Automatically update specified sections in reaper.ini without user confirmation.
+    Pass file_versions to reuse an existing collection of the root folder.
     """
-    file_versions = collect_files_in_folder("", paths, root_files=["reaper.ini"])
+    if file_versions is None:
+        file_versions = collect_files_in_folder("", paths, root_files=["reaper.ini"])
     for fname, versions in file_versions.items():
-        if len(versions) < 2:
+        if fname.lower() != "reaper.ini" or len(versions) < 2:
             continue
-        versions.sort(key=lambda x: x[1]['mtime'], reverse=True)
-        newest_path, _ = versions[0]
-        for old_path, _ in versions[1:]:
-            if os.path.abspath(newest_path) != os.path.abspath(old_path):
+        newest = max(versions, key=version_mtime)
+        newest_path, _ = newest
+        for old_path, _ in [v for v in versions if v is not newest]:
+            if newest_path != old_path:
                 update_reaper_ini_sections(old_path, newest_path, "", "", sections)
 
+def sync_missing_folder(folder, paths):
+    """
+    Copy a folder that exists in only one config to the other configs as a whole.
+    The user is asked once per target config instead of once per file.
+
+    Args:
+        folder (str): Subfolder name.
+        paths (list): List of dicts with 'config' and 'path' keys.
+
+    Returns:
+        bool: True if the folder exists in only one config, holds files and was offered for copying.
+    """
+    folder_paths = [(path, os.path.join(path["path"], folder)) for path in paths]
+    sources = [(path, folder_path) for path, folder_path in folder_paths if STAT_CACHE.isdir(folder_path)]
+    if len(sources) != 1:
+        return False
+    src, src_folder = sources[0]
+    files = iter_files(src_folder)
+    has_files = next(files, None) is not None  # Stop at the first file
+    files.close()
+    if not has_files:
+        return False  # No files, only empty folders at most (the file-by-file sync never asked either)
+    log_print(f"\nFolder '{folder}' only found in [config]: {src['config']} | [path]: {src['path']}")
+    for path, target_folder in folder_paths:
+        if path is src:
+            continue
+        resp = ask_user(f"Copy folder '{folder}' to '{path['config']}'? (y/n): ")
+        log_print(f"User response for copying folder '{folder}' to '{path['config']}': {resp}")
+        if resp.lower() != 'y':
+            continue
+        if TEST_MODE:
+            log_print(f"[TEST MODE] Would copy folder: {src_folder} -> {target_folder}")
+        else:
+            shutil.copytree(src_folder, target_folder, copy_function=fast_copy, dirs_exist_ok=True)
+            STAT_CACHE.forget_tree(target_folder)
+            STAT_CACHE.mark_written(target_folder)
+            log_print(f"Copied folder {src_folder} to {target_folder}")
+    return True
+
 def compare_and_sync_with_confirmation(folders, paths, root_files=None, reaper_ini_sections=None):
     """
     For all folders except root, compare and sync files with user confirmation.
     """
+    _find_config_cached.cache_clear()
+    sub_folders = [folder for folder in folders if folder != ""]  # Root handled separately
+    STAT_CACHE.prefetch([path["path"] for path in paths])
+    # Folders present in a single config are copied as a whole, no need to compare them file by file
+    present_counts = dict.fromkeys(sub_folders, 0)
+    for folder in sub_folders:
+        for path in paths:
+            folder_path = os.path.join(path["path"], folder)
+            if STAT_CACHE.isdir(folder_path):
+                present_counts[folder] += 1
+                _KNOWN_DIRS.add(folder_path)
+    compare_folders = [folder for folder in sub_folders if present_counts[folder] > 1]
     any_changes = False
-    for folder in folders:
-        if folder == "":
-            continue  # Root handled separately
-        file_versions = collect_files_in_folder(folder, paths, root_files=root_files)
-        for fname, versions in file_versions.items():
-            changed = sync_file_versions(
-                fname, versions, folder, paths,
-                root_files=root_files,
-                reaper_ini_sections=reaper_ini_sections
-            )
-            if changed:
-                any_changes = True
+    # Scanning is I/O bound, so all folders are collected in the background while
+    # the user is prompted about the folders that are already done
+    with ThreadPoolExecutor(max_workers=max(len(compare_folders), 1)) as executor:
+        futures = {folder: executor.submit(collect_files_in_folder, folder, paths,
+                                           root_files=root_files, divergent_only=True)
+                   for folder in compare_folders}
+        for folder in sub_folders:
+            if present_counts[folder] == 1:
+                if sync_missing_folder(folder, paths):
+                    any_changes = True
+                continue
+            if folder not in futures:
+                continue
+            for fname, versions in futures[folder].result().items():
+                changed = sync_file_versions(
+                    fname, versions, folder, paths,
+                    root_files=root_files,
+                    reaper_ini_sections=reaper_ini_sections
+                )
+                if changed:
+                    any_changes = True
     return any_changes
 
 class ReaperIni:
     """
     Class to read and modify sections in a .ini file (such as reaper.ini).
+    The file is kept as raw bytes and sections are copied without decoding.
     """
     def __init__(self, filepath):
         self.filepath = filepath
-        with open(filepath, 'r', encoding='utf-8') as f:
-            self.lines = f.readlines()
+        with open(filepath, 'rb') as f:
+            self.data = bytearray(f.read())  # Mutable, so sections can be replaced in place
+        self.sections = self.index_sections()
+        self.modified = False
+
+    def index_sections(self):
+        """
+        Locate all section headers with bytes.find and return the byte range of every section.
+        If a section occurs more than once, only the first occurrence is indexed.
+
+        Returns:
+            dict: {section_name_lower: (start_offset, end_offset)}, end_offset exclusive.
+        """
+        data = self.data
+        sections = {}
+        open_name = None
+        pos = 0 if data[:1] == b'[' else data.find(b'\n[')
+        while pos != -1:
+            if data[pos:pos + 1] == b'\n':
+                pos += 1  # Skip the newline in front of the header
+            line_end = data.find(b'\n', pos)
+            if line_end == -1:
+                line_end = len(data)
+            stripped = data[pos:line_end].rstrip()
+            name = stripped[1:-1].decode('utf-8', 'replace').lower() if stripped.endswith(b']') else None
+            if name is not None and name == open_name:
+                sections[name] = (pos, len(data))  # Repeated header restarts the open section
+            else:
+                if open_name is not None:
+                    sections[open_name] = (sections[open_name][0], pos)
+                if name is None or name in sections:
+                    open_name = None
+                else:
+                    sections[name] = (pos, len(data))
+                    open_name = name
+            pos = data.find(b'\n[', line_end)
+        return sections
+
+    def single_section_name(self, content):
+        """
+        Return the lower-cased section name if content is exactly one section:
+        a header on the first line, no further headers and a trailing newline.
+        Returns None otherwise.
+        """
+        if content[:1] != b'[' or b'\n[' in content or not content.endswith(b'\n'):
+            return None
+        header = content.split(b'\n', 1)[0].rstrip()
+        if not header.endswith(b']'):
+            return None
+        return header[1:-1].decode('utf-8', 'replace').lower()
 
     def get_section(self, section_name):
         """
-        Return the content of a section (including the [section] header) as a string.
-        Returns an empty string if not found.
+        Return the raw content of a section (including the [section] header) as bytes.
+        Returns empty bytes if not found.
         """
-        start_idx = None
-        end_idx = None
-        section_lines = []
-        in_section = False
-        for idx, line in enumerate(self.lines):
-            if line.strip().lower() == f'[{section_name.lower()}]':
-                start_idx = idx
-                in_section = True
-                section_lines = [line]
-                continue
-            if in_section:
-                if line.startswith('[') and line.strip().lower() != f'[{section_name.lower()}]':
-                    end_idx = idx
-                    break
-                section_lines.append(line)
-        if in_section and end_idx is None:
-            end_idx = len(self.lines)
-        if start_idx is not None:
-            return ''.join(section_lines)
-        return ''
+        bounds = self.sections.get(section_name.lower())
+        if bounds is None:
+            return b''
+        start, end = bounds
+        return bytes(self.data[start:end])
 
     def overwrite_section(self, section_name, content):
         """
-        Overwrite the given section with the provided content (string, including [section] header).
+        Overwrite the given section with the provided content (bytes or string, including [section] header).
         If the section does not exist, append it at the end.
+        Changes are kept in memory until flush() is called.
         """
-        start_idx = None
-        end_idx = None
-        in_section = False
-        for idx, line in enumerate(self.lines):
-            if line.strip().lower() == f'[{section_name.lower()}]':
-                start_idx = idx
-                in_section = True
-                continue
-            if in_section:
-                if line.startswith('[') and line.strip().lower() != f'[{section_name.lower()}]':
-                    end_idx = idx
-                    break
-        if in_section and end_idx is None:
-            end_idx = len(self.lines)
-        content_lines = content if isinstance(content, list) else content.splitlines(keepends=True)
-        if start_idx is not None:
-            self.lines = self.lines[:start_idx] + content_lines + self.lines[end_idx:]
+        if isinstance(content, list):
+            content = ''.join(content)
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        key = section_name.lower()
+        bounds = self.sections.get(key)
+        if bounds is not None:
+            start, end = bounds
+            if self.data[start:end] == content:
+                return  # Unchanged: do not rewrite the file and bump its mtime
+            self.data[start:end] = content
+            if self.single_section_name(content) == key:
+                # Same section replaced: shift the following sections instead of rescanning the file
+                delta = len(content) - (end - start)
+                self.sections = {name: (s + delta, e + delta) if s >= end else (s, e)
+                                 for name, (s, e) in self.sections.items()}
+                self.sections[key] = (start, start + len(content))
+            else:
+                self.sections = self.index_sections()
         else:
             # Append at end
-            if not self.lines or self.lines[-1].endswith('\n'):
-                self.lines += content_lines
-            else:
-                self.lines.append('\n')
-                self.lines += content_lines
-        #'''
-        # Write changes back to file
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            f.writelines(self.lines)
-        #'''
-        #print(f"Section '{section_name}' overwritten in {self.filepath}")
-        #print(f"New content:\n{content.strip()}\n")
+            if self.data and not self.data.endswith(b'\n'):
+                self.data += b'\r\n' if b'\r\n' in self.data else b'\n'
+            self.data += content
+            self.sections = self.index_sections()
+        self.modified = True
+
+    def flush(self):
+        """
+        Write all changes back to the file in one go. Does nothing if nothing was changed.
+        """
+        if not self.modified:
+            return
+        # Write changes to a sibling file and swap it in, so the ini is never left half-written
+        tmp_path = self.filepath + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.data)
+        shutil.copymode(self.filepath, tmp_path)
+        os.replace(tmp_path, self.filepath)
+        STAT_CACHE.mark_written(self.filepath)
+        self.modified = False
 
 if __name__ == "__main__":
     """
     Entry point for the script. Compares and synchronizes files in the specified subfolders and paths.
     """
     print_headline("Reaper Sync Tool: Check for changes in portable and main Reaper configurations")
-    auto_update_root_files(COMPARE_PATHS, ROOT_FILES)
-    auto_update_reaper_ini_sections(COMPARE_PATHS, REAPER_INI_SECTIONS)
+    root_versions = collect_files_in_folder("", COMPARE_PATHS, root_files=ROOT_FILES)
+    auto_update_root_files(COMPARE_PATHS, ROOT_FILES, file_versions=root_versions)
+    auto_update_reaper_ini_sections(COMPARE_PATHS, REAPER_INI_SECTIONS, file_versions=root_versions)
     any_changes = compare_and_sync_with_confirmation(SUB_FOLDERS, COMPARE_PATHS, root_files=ROOT_FILES, reaper_ini_sections=REAPER_INI_SECTIONS)
     if any_changes:
-        if VERBOSE: input("\nPress Enter to exit...")
+        if VERBOSE: ask_user("\nPress Enter to exit...")
     else:
         log_print("No changes detected.")
\ No newline at end of file